@@ -203,6 +203,52 @@ def get_section_rule_token(token):
     return token._.section.rule
 
 
+# the span and doc getters below are module-level functions rather than lambdas so that the extension state can be
+# pickled, which spaCy needs to do for nlp.pipe(texts, n_process=...) when processes are spawned instead of forked.
+def get_section_span(span):
+    return span[0]._.section
+
+
+def get_section_span_span(span):
+    return span[0]._.section_span
+
+
+def get_section_category_span(span):
+    return span[0]._.section_category
+
+
+def get_section_title_span(span):
+    return span[0]._.section_title
+
+
+def get_section_body_span(span):
+    return span[0]._.section_body
+
+
+def get_section_parent_span(span):
+    return span[0]._.section_parent
+
+
+def get_section_rule_span(span):
+    return span[0]._.section_rule
+
+
+def get_ent_data(doc):
+    return get_data(doc, "ents")
+
+
+def get_section_data(doc):
+    return get_data(doc, "section")
+
+
+def get_doc_data(doc):
+    return get_data(doc, "doc")
+
+
+def get_context_data(doc):
+    return get_data(doc, "context")
+
+
 def get_data(doc, dtype=None, attrs=None, as_rows=False):
     if doc._.data is None:
         import warnings
@@ -284,13 +330,13 @@ _span_extensions = {
     "window": {"method": get_window_span},
     "context_attributes": {"getter": get_context_attributes},
     "any_context_attributes": {"getter": any_context_attribute},
-    "section": {"getter": lambda x: x[0]._.section},
-    "section_span": {"getter": lambda x: x[0]._.section_span},
-    "section_category": {"getter": lambda x: x[0]._.section_category},
-    "section_title": {"getter": lambda x: x[0]._.section_title},
-    "section_body": {"getter": lambda x: x[0]._.section_body},
-    "section_parent": {"getter": lambda x: x[0]._.section_parent},
-    "section_rule": {"getter": lambda x: x[0]._.section_rule},
+    "section": {"getter": get_section_span},
+    "section_span": {"getter": get_section_span_span},
+    "section_category": {"getter": get_section_category_span},
+    "section_title": {"getter": get_section_title_span},
+    "section_body": {"getter": get_section_body_span},
+    "section_parent": {"getter": get_section_parent_span},
+    "section_rule": {"getter": get_section_rule_span},
     "contains": {"method": span_contains},
     "target_rule": {"default": None},
     "literal": {"getter": get_span_literal},
@@ -306,9 +352,9 @@ _doc_extensions = {
     "section_bodies": {"getter": get_section_body_spans},
     "get_data": {"method": get_data},
     "data": {"default": None},
-    "ent_data": {"getter": lambda doc: get_data(doc, "ents")},
-    "section_data": {"getter": lambda doc: get_data(doc, "section")},
-    "doc_data": {"getter": lambda doc: get_data(doc, "doc")},
-    "context_data": {"getter": lambda doc: get_data(doc, "context")},
+    "ent_data": {"getter": get_ent_data},
+    "section_data": {"getter": get_section_data},
+    "doc_data": {"getter": get_doc_data},
+    "context_data": {"getter": get_context_data},
     "to_dataframe": {"method": to_dataframe},
 }
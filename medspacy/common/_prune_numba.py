@@ -0,0 +1,61 @@
+"""
+Numba implementation of `medspacy.common.util.prune_overlapping_matches`. This module imports numpy and numba, so it is
+only imported the first time a large list of matches is pruned.
+"""
+from operator import itemgetter
+from typing import List, Tuple
+
+import numpy as np
+from numba import njit
+
+
+def prune_overlapping_matches_nb(
+    matches: List[Tuple[int, int, int]]
+) -> List[Tuple[int, int, int]]:
+    """
+    Prunes overlapping matches with the jitted sweep. The list of matches is not modified.
+
+    Args:
+        matches: A non-empty list of match tuples of form (match_id, start, end).
+
+    Returns:
+        The pruned list of matches, ordered by start.
+    """
+    # Only the starts and ends are converted, since that is faster than building a structured array of the full
+    # (match_id, start, end) tuples. Filling the arrays straight from itemgetter also measured faster than going
+    # through array.array buffers.
+    starts = np.fromiter(map(itemgetter(1), matches), dtype=np.int64, count=len(matches))
+    ends = np.fromiter(map(itemgetter(2), matches), dtype=np.int64, count=len(matches))
+    return [matches[i] for i in _prune(starts, ends).tolist()]
+
+
+@njit(cache=True)
+def _prune(starts, ends):
+    """
+    Numba implementation of the sweep in `prune_overlapping_matches`.
+
+    Args:
+        starts: An int64 array of match start indices.
+        ends: An int64 array of match end indices.
+
+    Returns:
+        An array with the indices of the matches to keep, ordered by start.
+    """
+    lengths = ends - starts
+    max_length = lengths.max() + 1
+    # stable sort on (start, -length) to match the ordering of the pure Python sweep
+    order = np.argsort(starts * max_length + (max_length - 1 - lengths), kind="mergesort")
+    kept = np.empty(len(order), dtype=np.int64)
+    num_kept = 0
+    curr_best = order[0]
+    for i in range(1, len(order)):
+        next_match = order[i]
+        if starts[next_match] < ends[curr_best]:
+            if lengths[next_match] > lengths[curr_best]:
+                curr_best = next_match
+        else:
+            kept[num_kept] = curr_best
+            num_kept += 1
+            curr_best = next_match
+    kept[num_kept] = curr_best
+    return kept[: num_kept + 1]
@@ -1,14 +1,60 @@
+import pickle
 import warnings
-from typing import Iterable, List, Dict, Tuple, Set
+from pathlib import Path
+from typing import Iterable, List, Dict, Tuple, Set, Union
 
-from spacy import Language
+from spacy import Language, Vocab
 from spacy.matcher import Matcher, PhraseMatcher
+from spacy.tokenizer import Tokenizer
 from spacy.tokens import Doc
 
 from .base_rule import BaseRule
 from .regex_matcher import RegexMatcher
 from .util import prune_overlapping_matches
 
+_STATE_FILE = "medspacy_matcher.pkl"
+
+
+def _has_affix(tokenizer: Tokenizer, text: str) -> bool:
+    """
+    Checks whether any of the tokenizer's prefix, suffix or infix rules match `text`, in which case the tokenizer may
+    split it into several tokens.
+    """
+    if tokenizer.prefix_search is not None and tokenizer.prefix_search(text):
+        return True
+    if tokenizer.suffix_search is not None and tokenizer.suffix_search(text):
+        return True
+    if tokenizer.infix_finditer is not None:
+        return next(tokenizer.infix_finditer(text), None) is not None
+    return False
+
+
+class _VocabPickler(pickle.Pickler):
+    """
+    Pickler which leaves out the spaCy Vocab so that a saved matcher does not contain a copy of the model vocabulary.
+    """
+
+    def persistent_id(self, obj):
+        if isinstance(obj, Vocab):
+            return "vocab"
+        return None
+
+
+class _VocabUnpickler(pickle.Unpickler):
+    """
+    Unpickler which restores the Vocab left out by _VocabPickler with the vocab of the matcher being loaded into.
+    """
+
+    def __init__(self, file, vocab: Vocab):
+        super().__init__(file)
+        self.vocab = vocab
+
+    def persistent_load(self, pid):
+        if pid == "vocab":
+            return self.vocab
+        raise pickle.UnpicklingError(f"Unsupported persistent id: {pid}")
+
+
 # suppress warnings here because the matchers warn if no patterns are specified, but since multiple matchers are
 # included that is not necessarily bad.
 warnings.filterwarnings("ignore")
@@ -43,15 +89,22 @@ class MedspacyMatcher:
                 of" and "history of" are both matches, setting prune to True would drop "history of". Default is True.
         """
         self.nlp = nlp.tokenizer # preserve only the tokenizer for creating phrasematcher rules
+        self._vocab = nlp.vocab
         self._rule_ids = set()
         self._labels = set()
         self._rule_map = dict()
+        # the same rules keyed by the StringStore hash of the rule id, which is the match_id in the returned matches
+        self._rule_hash_map = dict()
         self._prune = prune
         self.__matcher = Matcher(nlp.vocab)
         self.__phrase_matcher = PhraseMatcher(nlp.vocab, attr=phrase_matcher_attr)
         self.__regex_matcher = RegexMatcher(nlp.vocab)
 
         self.__rule_count = 0
+        # per-matcher rule counts so that matchers without any rules can be skipped when called
+        self.__matcher_rule_count = 0
+        self.__phrase_rule_count = 0
+        self.__regex_rule_count = 0
         self.__phrase_matcher_attr = phrase_matcher_attr
 
     @property
@@ -74,6 +127,17 @@ class MedspacyMatcher:
         """
         return self._rule_map
 
+    @property
+    def rule_hash_map(self) -> Dict[int, BaseRule]:
+        """
+        The dictionary mapping the hash of a rule's id, which is the match_id in the matches returned by the
+        MedspacyMatcher, to the rule object. This avoids looking up the id string for each match.
+
+        Returns:
+            A dictionary mapping the hash of the rule's id to the rule.
+        """
+        return self._rule_hash_map
+
     @property
     def labels(self) -> Set[str]:
         """
@@ -91,6 +155,11 @@ class MedspacyMatcher:
         Args:
             rules: A collection of rules. Each rule must inherit from `medspacy.common.BaseRule`.
         """
+        phrase_rules = []
+        # only lowercase when the phrase matcher is looking for lowercase matches. otherwise, expect users to handle
+        # phrases as aligned with their non-default phrase matching scheme. this prevents .lower() from blocking matches
+        # on attrs like ORTH or UPPER
+        lowercase_phrases = self.__phrase_matcher_attr.lower() == "lower"
         for rule in rules:
             if not isinstance(rule, BaseRule):
                 raise TypeError("Rules must inherit from medspacy.common.BaseRule.")
@@ -98,33 +167,122 @@ class MedspacyMatcher:
             rule_id = f"{rule.category}_{self.__rule_count}"
             rule._rule_id = rule_id
             self._rule_map[rule_id] = rule
+            self._rule_hash_map[self._vocab.strings.add(rule_id)] = rule
             if rule.pattern is not None:
                 # If it's a string, add a RegEx
                 if isinstance(rule.pattern, str):
                     self.__regex_matcher.add(rule_id, [rule.pattern], rule.on_match)
+                    self.__regex_rule_count += 1
                 # If it's a list, add a pattern dictionary
                 elif isinstance(rule.pattern, list):
                     self.__matcher.add(rule_id, [rule.pattern], on_match=rule.on_match)
+                    self.__matcher_rule_count += 1
                 else:
                     raise ValueError(
                         f"The pattern argument must be either a string or a list, not {type(rule.pattern)}"
                     )
             else:
-                if self.__phrase_matcher_attr.lower() == "lower":
-                    # only lowercase when the phrase matcher is looking for lowercase matches.
-                    text = rule.literal.lower()
-                else:
-                    # otherwise, expect users to handle phrases as aligned with their non-default phrase matching scheme
-                    # this prevents .lower() from blocking matches on attrs like ORTH or UPPER
-                    text = rule.literal
-                doc = self.nlp(text)
-                self.__phrase_matcher.add(
-                    rule_id,
-                    [doc],
-                    on_match=rule.on_match,
-                )
+                text = rule.literal.lower() if lowercase_phrases else rule.literal
+                phrase_rules.append((rule_id, text, rule.on_match))
             self.__rule_count += 1
 
+        # each phrase is added under its own rule id since components look up the source rule from the match id, so
+        # rules cannot share a PhraseMatcher key.
+        docs = [None] * len(phrase_rules)
+        to_tokenize = []
+        if isinstance(self.nlp, Tokenizer):
+            special_cases = self.nlp.rules
+            for i, (_, text, _) in enumerate(phrase_rules):
+                # a spaCy tokenizer keeps a run of ASCII letters as one token unless it is a special case like
+                # "cannot" or a prefix, suffix or infix rule applies, e.g. the "Rp" prefix of spacy.blank("id"). build
+                # these single-token docs directly and skip the tokenizer
+                if (
+                    text.isascii()
+                    and text.isalpha()
+                    and text not in special_cases
+                    and not _has_affix(self.nlp, text)
+                ):
+                    docs[i] = Doc(self._vocab, words=[text], spaces=[False])
+                else:
+                    to_tokenize.append(i)
+        else:
+            to_tokenize = list(range(len(phrase_rules)))
+
+        # tokenize the remaining phrases in one batch rather than one tokenizer call per rule
+        texts = [phrase_rules[i][1] for i in to_tokenize]
+        if hasattr(self.nlp, "pipe"):
+            tokenized = self.nlp.pipe(texts)
+        else:
+            # custom tokenizers such as the medspaCy Preprocessor may only be callable on a single text
+            tokenized = (self.nlp(text) for text in texts)
+        for i, doc in zip(to_tokenize, tokenized):
+            docs[i] = doc
+
+        for (rule_id, _, on_match), doc in zip(phrase_rules, docs):
+            self.__phrase_matcher.add(
+                rule_id,
+                [doc],
+                on_match=on_match,
+            )
+            self.__phrase_rule_count += 1
+
+    def to_disk(self, path: Union[str, Path]):
+        """
+        Saves the rules and compiled matchers to a directory so that they can be loaded with `from_disk` without
+        tokenizing and adding each rule again. Rules are pickled, so any `on_match` callbacks must be functions defined
+        at module level rather than lambdas.
+
+        Warning: the saved file is a pickle. Only share it with, and load it from, sources you trust.
+
+        Args:
+            path: The directory to save the matcher to. It will be created if it does not exist.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        state = {
+            "rule_map": self._rule_map,
+            "labels": self._labels,
+            "matcher": self.__matcher,
+            "phrase_matcher": self.__phrase_matcher,
+            "regex_matcher": self.__regex_matcher,
+            "rule_count": self.__rule_count,
+            "matcher_rule_count": self.__matcher_rule_count,
+            "phrase_rule_count": self.__phrase_rule_count,
+            "regex_rule_count": self.__regex_rule_count,
+            "phrase_matcher_attr": self.__phrase_matcher_attr,
+        }
+        with open(path / _STATE_FILE, "wb") as f:
+            _VocabPickler(f).dump(state)
+
+    def from_disk(self, path: Union[str, Path]) -> "MedspacyMatcher":
+        """
+        Loads rules and matchers saved with `to_disk`, replacing any rules already added to this matcher.
+
+        Warning: the file is loaded with pickle, which can execute arbitrary code. Never load a path from an untrusted
+        source.
+
+        Args:
+            path: The directory the matcher was saved to.
+
+        Returns:
+            The MedspacyMatcher with the loaded rules.
+        """
+        with open(Path(path) / _STATE_FILE, "rb") as f:
+            state = _VocabUnpickler(f, self._vocab).load()
+        self._rule_map = state["rule_map"]
+        self._labels = state["labels"]
+        self.__matcher = state["matcher"]
+        self.__phrase_matcher = state["phrase_matcher"]
+        self.__regex_matcher = state["regex_matcher"]
+        self.__rule_count = state["rule_count"]
+        self.__matcher_rule_count = state["matcher_rule_count"]
+        self.__phrase_rule_count = state["phrase_rule_count"]
+        self.__regex_rule_count = state["regex_rule_count"]
+        self.__phrase_matcher_attr = state["phrase_matcher_attr"]
+        # make sure the rule ids are in this vocab so that the match ids resolve to them
+        self._rule_hash_map = {self._vocab.strings.add(rule_id): rule for (rule_id, rule) in self._rule_map.items()}
+        return self
+
     def __call__(self, doc: Doc) -> List[Tuple[int, int, int]]:
         """
         Call MedspacyMatcher on a doc and return a single list of matches. If self.prune is True,
@@ -136,9 +294,16 @@ class MedspacyMatcher:
         Returns:
             A list of tuples, each containing 3 ints representing the individual match (match_id, start, end).
         """
-        matches = self.__matcher(doc)
-        matches += self.__phrase_matcher(doc)
-        matches += self.__regex_matcher(doc)
+        # the same (match_id, start, end) can be returned more than once, so drop duplicates before pruning. a dict is
+        # used rather than a set so that the match order is kept when prune is False.
+        unique = dict()
+        if self.__matcher_rule_count:
+            unique.update(dict.fromkeys(self.__matcher(doc)))
+        if self.__phrase_rule_count:
+            unique.update(dict.fromkeys(self.__phrase_matcher(doc)))
+        if self.__regex_rule_count:
+            unique.update(dict.fromkeys(self.__regex_matcher(doc)))
+        matches = list(unique)
         if self._prune:
             matches = prune_overlapping_matches(matches)
         return matches
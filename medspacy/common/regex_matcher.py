@@ -1,6 +1,7 @@
 import re
 import warnings
-from typing import Iterable, Callable, Optional, List, Tuple, Any
+from functools import lru_cache
+from typing import Iterable, Callable, Optional, List, Tuple, Any, Union
 
 from spacy import Vocab
 from spacy.matcher import Matcher
@@ -13,6 +14,33 @@ from .util import get_token_for_char
 # warnings.filterwarnings("once", "You are using a TargetRule with a regex pattern.*")
 
 
+@lru_cache(maxsize=4096)
+def _compile(pattern: Union[str, bytes], flags: re.RegexFlag) -> re.Pattern:
+    """
+    Compiles a regular expression, reusing the compiled pattern if the same pattern and flags were compiled before.
+    This avoids recompiling identical rules each time a pipeline is rebuilt.
+    """
+    return re.compile(pattern, flags=flags)
+
+
+# ASCII characters that \s matches in str patterns but not in bytes patterns
+_STR_ONLY_WHITESPACE = re.compile(r"[\x1c-\x1f]")
+
+
+def _compile_bytes(pattern: str, flags: re.RegexFlag) -> Optional[re.Pattern]:
+    """
+    Compiles an ASCII pattern for matching over ASCII-encoded text, which is faster than matching over `str`. Returns
+    None if the pattern cannot be used this way, for example if it contains non-ASCII characters or \\u escapes, or if
+    the flags include re.UNICODE.
+    """
+    if not pattern.isascii():
+        return None
+    try:
+        return _compile(pattern.encode("ascii"), flags)
+    except (re.error, ValueError):
+        return None
+
+
 class RegexMatcher:
     """
     The RegexMatcher is an alternative to spaCy's native Matcher and PhraseMatcher classes and allows matching based on
@@ -61,6 +89,8 @@ class RegexMatcher:
         self.resolve_start = resolve_start
         self.resolve_end = resolve_end
         self._patterns = {}
+        # patterns compiled for matching over ASCII bytes, aligned with self._patterns. None where not possible.
+        self._byte_patterns = {}
         self._callbacks = {}
         self.labels = set()
         self._rule_item_mapping = dict()
@@ -93,9 +123,13 @@ class RegexMatcher:
         if match_id not in self.vocab:
             self.vocab.strings.add(match_id)
         self._patterns.setdefault(self.vocab.strings[match_id], [])
+        self._byte_patterns.setdefault(self.vocab.strings[match_id], [])
         for pattern in regex_rules:
             self._patterns[self.vocab.strings[match_id]].append(
-                re.compile(pattern, flags=self.flags)
+                _compile(pattern, self.flags)
+            )
+            self._byte_patterns[self.vocab.strings[match_id]].append(
+                _compile_bytes(pattern, self.flags)
             )
             self._callbacks[self.vocab.strings[match_id]] = on_match
 
@@ -113,10 +147,24 @@ class RegexMatcher:
             The list of match tuples (match_id, start, end).
         """
         matches = []
+        # doc.text_with_ws is rebuilt from the tokens on every access, so build it once for all patterns
+        text = doc.text_with_ws
+        # regex matching over bytes is faster than over str. for ASCII text, byte offsets are the same as character
+        # offsets, so the matches can be used as is. \x1c-\x1f are whitespace for \s in str patterns but not in
+        # bytes patterns, so text containing them is matched as str.
+        text_bytes = (
+            text.encode("ascii")
+            if text.isascii() and _STR_ONLY_WHITESPACE.search(text) is None
+            else None
+        )
         for (match_id, patterns) in self._patterns.items():
-            for pattern in patterns:
-                on_match = self._callbacks[match_id]
-                for re_match in pattern.finditer(doc.text_with_ws):
+            on_match = self._callbacks[match_id]
+            for pattern, byte_pattern in zip(patterns, self._byte_patterns[match_id]):
+                if text_bytes is not None and byte_pattern is not None:
+                    re_matches = byte_pattern.finditer(text_bytes)
+                else:
+                    re_matches = pattern.finditer(text)
+                for re_match in re_matches:
                     span = doc.char_span(re_match.start(), re_match.end())
                     if span is None:
                         start = get_token_for_char(
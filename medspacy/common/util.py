@@ -7,7 +7,10 @@ from typing import Union, Tuple, List
 
 from spacy.tokens import Doc, Span, Token
 
-from ..util import tuple_overlaps
+# below this many matches the pure Python sweep is faster than converting the matches to arrays
+_NUMBA_MIN_MATCHES = 1000
+# the numba sweep, imported on the first list with at least _NUMBA_MIN_MATCHES matches. False if numba is not installed.
+_prune_nb = None
 
 
 def span_contains(
@@ -99,7 +102,8 @@ def prune_overlapping_matches(
     Prunes overlapping matches from a list of spaCy match tuples (match_id, start, end).
 
     Args:
-        matches: A list of match tuples of form (match_id, start, end).
+        matches: A list of match tuples of form (match_id, start, end). The list may be sorted in place, so pass a copy
+            if the original order is needed.
         strategy: The pruning strategy to use. At this time, the only available option is "longest" and will keep the
             longest of any two overlapping spans. Other behavior will be added in a future update.
 
@@ -111,37 +115,56 @@ def prune_overlapping_matches(
             "No other filtering strategy has been implemented. Coming in a future update."
         )
 
-    # Make a copy and sort
-    unpruned = sorted(matches, key=lambda x: (x[1], x[2]))
-    pruned = []
-    num_matches = len(matches)
-    if num_matches == 0:
+    if len(matches) == 0:
         return matches
-    curr_match = unpruned.pop(0)
-
-    while True:
-        if len(unpruned) == 0:
-            pruned.append(curr_match)
-            break
-        next_match = unpruned.pop(0)
-
-        # Check if they overlap
-        if overlaps(curr_match, next_match):
-            # Choose the larger span
-            longer_span = max(curr_match, next_match, key=lambda x: (x[2] - x[1]))
-            pruned.append(longer_span)
-            if len(unpruned) == 0:
-                break
-            curr_match = unpruned.pop(0)
+
+    # The sweep can't be vectorized with numpy without changing results: keeping only the longest match of each
+    # transitively overlapping cluster would drop matches that the sweep keeps, e.g. (0, 3) in (0, 3), (2, 5), (4, 7).
+    # Large match lists are instead handed to the jitted sweep if numba is installed.
+    if len(matches) >= _NUMBA_MIN_MATCHES:
+        prune_nb = _get_prune_nb()
+        if prune_nb:
+            return prune_nb(matches)
+
+    # Sort in place by start and longest first so a single sweep can keep the longest span of each overlapping run.
+    # For matches with the same start, the latest end is also the longest, so the key doesn't need the length and each
+    # length is only computed once, in the sweep below.
+    matches.sort(key=lambda m: (m[1], -m[2]))
+    pruned = []
+    curr_best = matches[0]
+    _, _, curr_end = curr_best
+    curr_length = curr_end - curr_best[1]
+    for i in range(1, len(matches)):
+        next_match = matches[i]
+        _, next_start, next_end = next_match
+        next_length = next_end - next_start
+        # Matches are sorted by start, so the pair overlaps iff the next match starts before the current one ends
+        if next_start < curr_end:
+            # Keep whichever is longer
+            if next_length > curr_length:
+                curr_best, curr_end, curr_length = next_match, next_end, next_length
         else:
-            pruned.append(curr_match)
-            curr_match = next_match
-    # Recursive base point
-    if len(pruned) == num_matches:
-        return pruned
-    # Recursive function call
-    else:
-        return prune_overlapping_matches(pruned)
+            pruned.append(curr_best)
+            curr_best, curr_end, curr_length = next_match, next_end, next_length
+    pruned.append(curr_best)
+    return pruned
+
+
+def _get_prune_nb():
+    """
+    Imports the numba sweep the first time it is needed, so that importing medspaCy doesn't import numpy and numba.
+
+    Returns:
+        The numba pruning function, or False if numba is not installed.
+    """
+    global _prune_nb
+    if _prune_nb is None:
+        try:
+            from ._prune_numba import prune_overlapping_matches_nb as _prune_nb
+        except ImportError:
+            # numba is optional. Without it, pruning uses the pure Python sweep.
+            _prune_nb = False
+    return _prune_nb
 
 
 def overlaps(a: Tuple[int, int, int], b: Tuple[int, int, int]) -> bool:
@@ -155,9 +178,7 @@ def overlaps(a: Tuple[int, int, int], b: Tuple[int, int, int]) -> bool:
     Returns:
         Whether the tuples overlap.
     """
-    _, a_start, a_end = a
-    _, b_start, b_end = b
-    return tuple_overlaps((a_start, a_end), (b_start, b_end))
+    return a[1] < b[2] and b[1] < a[2]
 
 
 def matches_to_spans(
@@ -177,7 +198,8 @@ def matches_to_spans(
     spans = []
     for (rule_id, start, end) in matches:
         if set_label:
-            label = doc.vocab.strings[rule_id]
+            # the match id is already the StringStore hash of the rule id, which Span accepts as a label directly
+            label = rule_id
         else:
             label = None
         spans.append(Span(doc, start=start, end=end, label=label))
@@ -7,7 +7,7 @@ from typing import Iterable, Union, Optional, Dict, Any, Set, Literal
 from spacy.language import Language
 from spacy.tokens import Doc, Span
 
-from .context_graph import ConTextGraph
+from .context_graph import ConTextGraph, get_context_graph, set_context_graph
 from .context_modifier import ConTextModifier
 from .context_rule import ConTextRule
 from ..common.medspacy_matcher import MedspacyMatcher
@@ -244,7 +244,12 @@ class ConText:
         Registers spaCy attribute extensions: Span._.modifiers and Doc._.context_graph.
         """
         Span.set_extension("modifiers", default=(), force=True)
-        Doc.set_extension("context_graph", default=None, force=True)
+        Doc.set_extension(
+            "context_graph",
+            getter=get_context_graph,
+            setter=set_context_graph,
+            force=True,
+        )
 
     @classmethod
     def register_default_attributes(cls):
@@ -306,7 +311,7 @@ class ConText:
 
         for (match_id, start, end) in matches:
             # Get the ConTextRule object defining this modifier
-            rule = self.__matcher.rule_map[self.nlp.vocab[match_id].text]
+            rule = self.__matcher.rule_hash_map[match_id]
             modifier = ConTextModifier(rule, start, end, doc, max_scope=self.max_scope)
             context_graph.modifiers.append(modifier)
 
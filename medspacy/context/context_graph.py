@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Optional, List, Dict, Any
 
 import srsly
-from spacy.tokens import Span
+from spacy.tokens import Doc, Span
 
 from ..context import ConTextModifier
 from ..util import tuple_overlaps
@@ -38,6 +38,9 @@ class ConTextGraph:
         self.modifiers = modifiers if modifiers is not None else []
         self.edges = edges if edges is not None else []
         self.prune_on_modifier_overlap = prune_on_modifier_overlap
+        # targets and edges of a deserialized graph, stored as token offsets until the spans can be rebuilt with a doc
+        self._serialized_targets = None
+        self._serialized_edges = None
 
     def update_scopes(self):
         """
@@ -91,19 +94,65 @@ class ConTextGraph:
 
     def serialized_representation(self) -> Dict[str, Any]:
         """
-        Returns the serialized representation of the ConTextGraph
+        Returns the serialized representation of the ConTextGraph. Spans cannot be serialized, so targets are stored as
+        (start, end, label) and edges as (target start, target end, modifier index).
         """
-        return self.__dict__
+        if self._serialized_targets is not None:
+            # deserialized but never accessed through its doc, so the offsets are still up to date
+            return {
+                "targets": self._serialized_targets,
+                "modifiers": self.modifiers,
+                "edges": self._serialized_edges,
+                "prune_on_modifier_overlap": self.prune_on_modifier_overlap,
+            }
+        modifier_indices = {id(modifier): i for i, modifier in enumerate(self.modifiers)}
+        return {
+            "targets": [(target.start, target.end, target.label_) for target in self.targets],
+            "modifiers": self.modifiers,
+            "edges": [
+                (target.start, target.end, modifier_indices[id(modifier)]) for (target, modifier) in self.edges
+            ],
+            "prune_on_modifier_overlap": self.prune_on_modifier_overlap,
+        }
 
     @classmethod
     def from_serialized_representation(cls, serialized_representation) -> ConTextGraph:
         """
-        Creates the ConTextGraph from the serialized representation
+        Creates the ConTextGraph from the serialized representation. The targets and edges are rebuilt as spans once
+        the graph is accessed through `doc._.context_graph`, see `restore_spans`.
         """
-        context_graph = ConTextGraph(**serialized_representation)
+        context_graph = ConTextGraph(
+            modifiers=serialized_representation["modifiers"],
+            prune_on_modifier_overlap=serialized_representation["prune_on_modifier_overlap"],
+        )
+        context_graph._serialized_targets = serialized_representation["targets"]
+        context_graph._serialized_edges = serialized_representation["edges"]
 
         return context_graph
 
+    def restore_spans(self, doc: Doc):
+        """
+        Rebuilds the target spans and edges of a deserialized graph over `doc`. Does nothing if the graph was not
+        deserialized or has already been restored.
+
+        Args:
+            doc: The spaCy Doc the graph belongs to.
+        """
+        if self._serialized_targets is None:
+            return
+        targets = [Span(doc, start, end, label=label) for (start, end, label) in self._serialized_targets]
+        targets_by_offsets = {(target.start, target.end): target for target in targets}
+        edges = []
+        for (start, end, modifier_index) in self._serialized_edges:
+            target = targets_by_offsets[(start, end)]
+            modifier = self.modifiers[modifier_index]
+            modifier.modify(target)
+            edges.append((target, modifier))
+        self.targets = targets
+        self.edges = edges
+        self._serialized_targets = None
+        self._serialized_edges = None
+
 
 @srsly.msgpack_encoders("context_graph")
 def serialize_context_graph(obj, chain=None):
@@ -117,3 +166,28 @@ def deserialize_context_graph(obj, chain=None):
     if "context_graph" in obj:
         return ConTextGraph.from_serialized_representation(obj["context_graph"])
     return obj if chain is None else chain(obj)
+
+
+# The key spaCy's Underscore uses for Doc extensions with a default value. This copies spaCy's private key layout so
+# that the graph is stored where `Doc.set_extension("context_graph", default=None)` would store it.
+# tests/serialization/test_serialization.py checks that the layout still matches.
+_CONTEXT_GRAPH_KEY = ("._.", "context_graph", None, None)
+
+
+def get_context_graph(doc: Doc) -> Optional[ConTextGraph]:
+    """
+    Getter for `doc._.context_graph`. Rebuilds the target spans and edges if the doc was deserialized, for example
+    after `nlp.pipe(texts, n_process=...)`.
+    """
+    context_graph = doc.user_data.get(_CONTEXT_GRAPH_KEY)
+    if context_graph is not None:
+        context_graph.restore_spans(doc)
+    return context_graph
+
+
+def set_context_graph(doc: Doc, context_graph: Optional[ConTextGraph]):
+    """
+    Setter for `doc._.context_graph`. Stores the graph in `doc.user_data` under the same key as a default extension
+    so that it is serialized with the doc.
+    """
+    doc.user_data[_CONTEXT_GRAPH_KEY] = context_graph
@@ -400,16 +400,19 @@ def serialize_modifiers(obj, chain=None):
 @srsly.msgpack_encoders("modifier")
 def serialize_modifier(obj, chain=None):
     if isinstance(obj, ConTextModifier):
-        return obj.serialized_representation()
+        return {"modifier": obj.serialized_representation()}
     return obj if chain is None else chain(obj)
 
 
 @srsly.msgpack_decoders("modifiers")
 def deserialize_modifiers(obj, chain=None):
     if "modifiers" in obj:
+        # modifiers encoded one at a time have already been decoded by deserialize_modifier
         obj["modifiers"] = [
-            ConTextModifier.from_serialized_representation(serialized_modifier)
-            for serialized_modifier in obj["modifiers"]
+            modifier
+            if isinstance(modifier, ConTextModifier)
+            else ConTextModifier.from_serialized_representation(modifier)
+            for modifier in obj["modifiers"]
         ]
         return obj
     return obj if chain is None else chain(obj)
@@ -418,5 +421,7 @@ def deserialize_modifiers(obj, chain=None):
 @srsly.msgpack_decoders("modifier")
 def deserialize_modifier(obj, chain=None):
     if "modifier" in obj:
+        if isinstance(obj["modifier"], ConTextModifier):
+            return obj["modifier"]
         return ConTextModifier.from_serialized_representation(obj["modifier"])
     return obj if chain is None else chain(obj)
@@ -276,7 +276,7 @@ class Sectionizer:
         sections_final = []
         removed_sections = 0
         for i, (match_id, start, end) in enumerate(sections):
-            name = self.__matcher.rule_map[self.nlp.vocab.strings[match_id]].category
+            name = self.__matcher.rule_hash_map[match_id].category
             required = self._parent_required[name]
             i_a = i - removed_sections  # adjusted index for removed values
             if required and i_a == 0:
@@ -289,15 +289,13 @@ class Sectionizer:
                 identified_parent = None
                 for parent in parents:
                     # go backwards through the section "tree" until you hit a root or the start of the list
-                    candidate = self.__matcher.rule_map[
-                        self.nlp.vocab.strings[sections_final[i_a - 1][0]]
+                    candidate = self.__matcher.rule_hash_map[
+                        sections_final[i_a - 1][0]
                     ].category
                     candidates_parent_idx = sections_final[i_a - 1][3]
                     if candidates_parent_idx is not None:
-                        candidates_parent = self.__matcher.rule_map[
-                            self.nlp.vocab.strings[
-                                sections_final[candidates_parent_idx][0]
-                            ]
+                        candidates_parent = self.__matcher.rule_hash_map[
+                            sections_final[candidates_parent_idx][0]
                         ].category
                     else:
                         candidates_parent = None
@@ -316,17 +314,13 @@ class Sectionizer:
                                 candidate = None
                                 continue
                             # otherwise get the previous item in the list
-                            temp = self.__matcher.rule_map[
-                                self.nlp.vocab.strings[
-                                    sections_final[candidate_i - 1][0]
-                                ]
+                            temp = self.__matcher.rule_hash_map[
+                                sections_final[candidate_i - 1][0]
                             ].category
                             temp_parent_idx = sections_final[candidate_i - 1][3]
                             if temp_parent_idx is not None:
-                                temp_parent = self.__matcher.rule_map[
-                                    self.nlp.vocab.strings[
-                                        sections_final[temp_parent_idx][0]
-                                    ]
+                                temp_parent = self.__matcher.rule_hash_map[
+                                    sections_final[temp_parent_idx][0]
                                 ].category
                             else:
                                 temp_parent = None
@@ -414,7 +408,7 @@ class Sectionizer:
                 # IDEs will warn here about match shape disagreeing w/ type hinting, but this if is only used if
                 # parent sections were never set, so parent_idx does not exist
                 (match_id, start, end) = match
-            rule = self.__matcher.rule_map[self.nlp.vocab.strings[match_id]]
+            rule = self.__matcher.rule_hash_map[match_id]
             category = rule.category
             # If this is the last match, it should include the rest of the doc
             if i == len(matches) - 1:
@@ -77,7 +77,7 @@ class ConceptTagger:
         """
         matches = self.__matcher(doc)
         for (rule_id, start, end) in matches:
-            rule = self.__matcher.rule_map[self.nlp.vocab.strings[rule_id]]
+            rule = self.__matcher.rule_hash_map[rule_id]
             for i in range(start, end):
                 setattr(doc[i]._, self.attr_name, rule.category)
 
@@ -144,7 +144,7 @@ class TargetMatcher:
         matches = self.__matcher(doc)
         spans = []
         for (rule_id, start, end) in matches:
-            rule = self.__matcher.rule_map[self.nlp.vocab.strings[rule_id]]
+            rule = self.__matcher.rule_hash_map[rule_id]
             span = Span(doc, start=start, end=end, label=rule.category)
             span._.target_rule = rule
             if rule.attributes is not None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Dict, Callable, Any, List, Tuple, Union, Optional
 
+import srsly
 from spacy.matcher import Matcher
 from spacy.tokens import Doc
 
@@ -131,3 +132,17 @@ class TargetRule(BaseRule):
 
     def __repr__(self):
         return f"""TargetRule(literal="{self.literal}", category="{self.category}", pattern={self.pattern}, attributes={self.attributes}, on_match={self.on_match})"""
+
+
+@srsly.msgpack_encoders("target_rule")
+def serialize_target_rule(obj, chain=None):
+    if isinstance(obj, TargetRule):
+        return {"target_rule": obj.to_dict()}
+    return obj if chain is None else chain(obj)
+
+
+@srsly.msgpack_decoders("target_rule")
+def deserialize_target_rule(obj, chain=None):
+    if "target_rule" in obj:
+        return TargetRule.from_dict(obj["target_rule"])
+    return obj if chain is None else chain(obj)
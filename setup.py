@@ -68,6 +68,7 @@ setup(
         "jsonschema",
     ]
     + additional_installs,
+    extras_require={"numba": ["numba"]},
     long_description=long_description,
     long_description_content_type="text/markdown",
     package_data={"medspacy": resource_files},
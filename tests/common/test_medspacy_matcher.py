@@ -1,8 +1,14 @@
+import importlib.util
+import pickle
+
 import spacy
 import warnings
 
+import pytest
+
 from medspacy.common.medspacy_matcher import MedspacyMatcher
 from medspacy.common import BaseRule
+from medspacy.common import util
 
 nlp = spacy.blank("en")
 
@@ -16,6 +22,40 @@ class TestTargetMatcher:
         matcher.add([BaseRule("pneumonia", "CONDITION")])
         assert matcher.rules
 
+    def test_add_unique_rule_ids(self):
+        matcher = MedspacyMatcher(nlp)
+        matcher.add([BaseRule("pneumonia", "CONDITION"), BaseRule("pna", "CONDITION")])
+        matcher.add([BaseRule("chf", "CONDITION")])
+        assert len(matcher.rule_map) == 3
+        assert len({rule._rule_id for rule in matcher.rules}) == 3
+
+    def test_add_single_token_phrases(self):
+        matcher = MedspacyMatcher(nlp)
+        matcher.add(
+            [
+                BaseRule("Stroke", "CONDITION"),
+                BaseRule("cannot", "NEGATED_EXISTENCE"),
+                BaseRule("s/p", "HISTORICAL"),
+            ]
+        )
+        doc = nlp("stroke cannot s/p")
+        assert [doc[start:end].text for (_, start, end) in matcher(doc)] == ["stroke", "cannot", "s/p"]
+
+    def test_add_single_token_phrase_with_prefix(self):
+        # the Indonesian tokenizer splits the "Rp" currency prefix off "RpX"
+        nlp_id = spacy.blank("id")
+        matcher = MedspacyMatcher(nlp_id, phrase_matcher_attr="ORTH")
+        matcher.add([BaseRule("RpX", "CURRENCY")])
+        doc = nlp_id("bayar RpX sekarang")
+        assert [doc[start:end].text for (_, start, end) in matcher(doc)] == ["RpX"]
+
+    def test_rule_hash_map(self):
+        matcher = MedspacyMatcher(nlp)
+        rule = BaseRule("pneumonia", "CONDITION")
+        matcher.add([rule])
+        (match_id, _, _), = matcher(nlp("pneumonia"))
+        assert matcher.rule_hash_map[match_id] is rule
+
     def test_prune_overlapping_matching(self):
         matcher = MedspacyMatcher(nlp, prune=True)
         matcher.add(
@@ -30,6 +70,52 @@ class TestTargetMatcher:
         _, start, end = matches[0]
         assert doc[start:end].text == "no history of"
 
+    def test_prune_nested_overlaps(self):
+        matcher = MedspacyMatcher(nlp, prune=True)
+        matcher.add(
+            [
+                BaseRule("history", "HISTORICAL"),
+                BaseRule("history of", "HISTORICAL"),
+                BaseRule("of pneumonia", "CONDITION"),
+                BaseRule("no history of pneumonia", "NEGATED_EXISTENCE"),
+            ]
+        )
+        doc = nlp("no history of pneumonia")
+        matches = matcher(doc)
+        assert len(matches) == 1
+        _, start, end = matches[0]
+        assert doc[start:end].text == "no history of pneumonia"
+
+    def test_prune_overlapping_matches_one_pass(self):
+        matches = [(1, 2, 3), (2, 0, 4), (3, 1, 3), (4, 0, 1), (5, 5, 6)]
+        assert util.prune_overlapping_matches(matches) == [(2, 0, 4), (5, 5, 6)]
+
+    def test_prune_keeps_match_overlapping_only_dropped_matches(self):
+        # (3, 11, 13) starts after the kept (2, 4, 10) ends, so the sweep starts a new run with it. The recursive
+        # pruner this replaced dropped it for overlapping (4, 8, 12), which was itself dropped
+        matches = [
+            (4, 8, 12),
+            (3, 11, 12),
+            (3, 3, 7),
+            (1, 6, 8),
+            (2, 8, 9),
+            (3, 11, 13),
+            (1, 13, 14),
+            (2, 4, 10),
+            (1, 1, 6),
+        ]
+        assert util.prune_overlapping_matches(matches) == [
+            (2, 4, 10),
+            (3, 11, 13),
+            (1, 13, 14),
+        ]
+
+    def test_prune_drops_chained_overlaps(self):
+        # (0, 2) overlaps no kept match. It is dropped because the longer (1, 4) replaced it as the best match of the
+        # run, and (1, 4) was then replaced by the longer (3, 9)
+        matches = [(1, 0, 2), (2, 1, 4), (3, 3, 9)]
+        assert util.prune_overlapping_matches(matches) == [(3, 3, 9)]
+
     def test_prune_false(self):
         matcher = MedspacyMatcher(nlp, prune=False)
         matcher.add(
@@ -41,3 +127,42 @@ class TestTargetMatcher:
         doc = nlp("no history of pneumonia")
         matches = matcher(doc)
         assert len(matches) == 2
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("numba") is None, reason="numba is not installed"
+    )
+    def test_prune_numba_matches_python(self, monkeypatch):
+        matches = [(i % 7, (i * 37) % 2000, (i * 37) % 2000 + i % 5 + 1) for i in range(2000)]
+        monkeypatch.setattr(util, "_NUMBA_MIN_MATCHES", 1)
+        numba_pruned = util.prune_overlapping_matches(matches)
+        monkeypatch.setattr(util, "_NUMBA_MIN_MATCHES", float("inf"))
+        assert numba_pruned == util.prune_overlapping_matches(matches)
+
+    def test_pickle(self):
+        matcher = MedspacyMatcher(nlp)
+        matcher.add(
+            [
+                BaseRule("pneumonia", "CONDITION"),
+                BaseRule("cough", "SYMPTOM", pattern=[{"LOWER": "cough"}]),
+                BaseRule("diagnosed in <YEAR>", "HISTORICAL", pattern=r"diagnosed in \d{4}"),
+            ]
+        )
+        doc = nlp("pneumonia and cough diagnosed in 2001")
+        assert pickle.loads(pickle.dumps(matcher))(doc) == matcher(doc)
+
+    def test_to_from_disk(self, tmp_path):
+        matcher = MedspacyMatcher(nlp)
+        matcher.add(
+            [
+                BaseRule("pneumonia", "CONDITION"),
+                BaseRule("cough", "SYMPTOM", pattern=[{"LOWER": "cough"}]),
+                BaseRule("diagnosed in <YEAR>", "HISTORICAL", pattern=r"diagnosed in \d{4}"),
+            ]
+        )
+        matcher.to_disk(tmp_path)
+        loaded = MedspacyMatcher(nlp).from_disk(tmp_path)
+        doc = nlp("pneumonia and cough diagnosed in 2001")
+        assert loaded(doc) == matcher(doc)
+        assert set(loaded.rule_map) == set(matcher.rule_map)
+        assert loaded.labels == matcher.labels
+        assert set(loaded.rule_hash_map) == set(matcher.rule_hash_map)
@@ -1,5 +1,6 @@
 import spacy
 import warnings
+from spacy.tokens import Doc
 
 from medspacy.common.regex_matcher import RegexMatcher
 
@@ -15,6 +16,13 @@ class TestTargetMatcher:
         matcher.add("my_rule", ["my_pattern"])
         assert matcher._patterns
 
+    def test_compiled_pattern_shared(self):
+        matcher_1 = RegexMatcher(nlp.vocab)
+        matcher_1.add("my_rule", ["my_pattern"])
+        matcher_2 = RegexMatcher(nlp.vocab)
+        matcher_2.add("my_rule", ["my_pattern"])
+        assert matcher_1.get("my_rule")[0] is matcher_2.get("my_rule")[0]
+
     def test_basic_match(self):
         matcher = RegexMatcher(nlp.vocab)
         matcher.add("CONDITION", ["pulmonary embolisms?"])
@@ -27,6 +35,26 @@ class TestTargetMatcher:
         span = doc[start:end]
         assert span.text == "Pulmonary embolism"
 
+    def test_match_non_ascii_text(self):
+        matcher = RegexMatcher(nlp.vocab)
+        matcher.add("CONDITION", ["pulmonary embolisms?", "syndrome de sjögren"])
+        doc = nlp("Café visit: pulmonary embolism, syndrome de Sjögren")
+        spans = [doc[start:end].text for (_, start, end) in matcher(doc)]
+        assert spans == ["pulmonary embolism", "syndrome de Sjögren"]
+
+    def test_match_ascii_separator_whitespace(self):
+        matcher = RegexMatcher(nlp.vocab)
+        matcher.add("ENTITY", [r"a\sb"])
+        doc = Doc(nlp.vocab, words=["a\x1cb", "a\x1fb"])
+        assert [doc[start:end].text for (_, start, end) in matcher(doc)] == [
+            "a\x1cb",
+            "a\x1fb",
+        ]
+
+        matcher = RegexMatcher(nlp.vocab)
+        matcher.add("ENTITY", [r"a\Sb"])
+        assert matcher(doc) == []
+
     def test_resolve_default(self):
         matcher = RegexMatcher(nlp.vocab)
         matcher.add("ENTITY", ["ICE: Rad"])
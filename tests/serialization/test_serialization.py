@@ -2,9 +2,11 @@ from typing import List
 import pytest
 import spacy
 import srsly
-from spacy.tokens import Span, Doc
+from spacy.tokens import Span, Doc, DocBin
 from medspacy.context import ConTextRule, ConTextGraph, ConTextModifier
+from medspacy.context.context_graph import _CONTEXT_GRAPH_KEY
 from medspacy.section_detection import Section, SectionRule, Sectionizer
+from medspacy.target_matcher import TargetMatcher, TargetRule
 
 Span.set_extension("modifiers", default=(), force=True)
 Doc.set_extension("context_graph", default=None, force=True)
@@ -83,3 +85,78 @@ class TestSerialization:
         assert isinstance(
             deserialized_doc._.context_graph.modifiers[0], ConTextModifier
         )
+
+    def test_serialize_doc_with_target_rule(self, nlp):
+        matcher = TargetMatcher(nlp)
+        matcher.add([TargetRule("pneumonia", "CONDITION")])
+        doc = matcher(nlp("Past Medical History: Pneumonia"))
+        serialized_doc = doc.to_bytes()
+        deserialized_doc = Doc(doc.vocab).from_bytes(serialized_doc)
+
+        assert isinstance(deserialized_doc.ents[0]._.target_rule, TargetRule)
+        assert deserialized_doc.ents[0]._.target_rule.literal == "pneumonia"
+
+    def test_serialize_doc_with_context_component(self):
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        nlp.add_pipe("medspacy_target_matcher").add(
+            [TargetRule("pneumonia", "CONDITION")]
+        )
+        nlp.add_pipe("medspacy_context")
+        doc = nlp("There is no evidence of pneumonia.")
+        deserialized_doc = Doc(doc.vocab).from_bytes(doc.to_bytes())
+
+        graph = deserialized_doc._.context_graph
+        assert isinstance(graph.targets[0], Span)
+        assert graph.targets[0].text == "pneumonia"
+        assert len(graph.edges) == 1
+        target, modifier = graph.edges[0]
+        assert target is graph.targets[0]
+        assert modifier is graph.modifiers[0]
+        assert modifier.category == "NEGATED_EXISTENCE"
+
+    def test_serialize_doc_with_context_component_twice(self):
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        nlp.add_pipe("medspacy_target_matcher").add(
+            [TargetRule("pneumonia", "CONDITION")]
+        )
+        nlp.add_pipe("medspacy_context")
+        doc = nlp("There is no evidence of pneumonia.")
+        # serialize the deserialized doc again without accessing doc._.context_graph in between
+        once = Doc(doc.vocab).from_bytes(doc.to_bytes())
+        twice = Doc(doc.vocab).from_bytes(once.to_bytes())
+
+        graph = twice._.context_graph
+        assert graph.targets[0].text == "pneumonia"
+        assert len(graph.edges) == 1
+        assert graph.edges[0][1].category == "NEGATED_EXISTENCE"
+
+    def test_context_graph_key_matches_default_extension(self, nlp):
+        Doc.set_extension("medspacy_test_default", default=None, force=True)
+        doc = nlp.tokenizer("pneumonia")
+        doc._.medspacy_test_default = 1
+        (key,) = doc.user_data
+        assert key[1] == "medspacy_test_default"
+        assert _CONTEXT_GRAPH_KEY == (key[0], "context_graph") + key[2:]
+        Doc.remove_extension("medspacy_test_default")
+
+    def test_pipe_multiprocessing_with_context(self):
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        nlp.add_pipe("medspacy_target_matcher").add(
+            [TargetRule("pneumonia", "CONDITION")]
+        )
+        nlp.add_pipe("medspacy_context")
+        texts = ["There is no evidence of pneumonia."] * 4
+        docs = list(nlp.pipe(texts, n_process=2, batch_size=2))
+        # docs from the worker processes can be serialized again before the graph is accessed
+        doc_bin = DocBin(store_user_data=True, docs=docs)
+        docs = list(DocBin().from_bytes(doc_bin.to_bytes()).get_docs(nlp.vocab))
+
+        assert len(docs) == 4
+        for doc in docs:
+            assert doc.ents[0]._.is_negated is True
+            graph = doc._.context_graph
+            assert isinstance(graph.targets[0], Span)
+            assert graph.edges[0][0].text == "pneumonia"